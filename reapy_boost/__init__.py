@@ -1,5 +1,9 @@
 import sys
 
+# Whether the process runs inside REAPER cannot change after startup,
+# so the probe result is cached after the first call.
+_INSIDE_REAPER = None
+
 
 def is_inside_reaper() -> bool:
     """
@@ -9,8 +13,10 @@ def is_inside_reaper() -> bool:
     controls another REAPER instance on a slave machine (with
     ``reapy_boost.connect``), return False.
     """
-    inside = hasattr(sys.modules["__main__"], "obj")
-    if not inside:
+    global _INSIDE_REAPER
+    if _INSIDE_REAPER is None:
+        _INSIDE_REAPER = hasattr(sys.modules["__main__"], "obj")
+    if not _INSIDE_REAPER:
         return False
     else:
         try:
@@ -126,7 +132,9 @@ __all__ = [
     'reaprint',
     'remove_reascript',
     'rgb_from_native',
+    'rgb_from_native_bulk',
     'rgb_to_native',
+    'rgb_to_native_bulk',
     'set_ext_state',
     'set_global_automation_mode',
     'show_console_message',
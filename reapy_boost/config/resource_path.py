@@ -1,15 +1,11 @@
 """Find REAPER resource path without ``reapy_boost`` dist API enabled."""
 
+import functools
 import os
 from typing import Generator
 
-import reapy_boost
 from .shared_library import is_windows, is_apple
 
-if not reapy_boost.is_inside_reaper():
-    # Third-party imports crash REAPER when run inside it.
-    import psutil
-
 
 def get_candidate_directories(
     detect_portable_install: bool = True
@@ -31,9 +27,14 @@ def get_portable_resource_directory() -> str:
     return os.path.dirname(process_path)
 
 
+@functools.lru_cache(maxsize=None)
 def get_reaper_process_path() -> str:
     """Return path to currently running REAPER process.
 
+    The result is cached for the process lifetime, as scanning all OS
+    processes is expensive. Use ``get_reaper_process_path.cache_clear``
+    to force a new scan.
+
     Returns
     -------
     str
@@ -45,8 +46,15 @@ def get_reaper_process_path() -> str:
         When zero or more than one REAPER instances are currently
         running.
     """
+    # psutil is imported here and not at module level for two reasons:
+    # third-party imports crash REAPER when run inside it, and the
+    # common non-portable install never needs the process scan at all.
+    import psutil
+
+    # Only ask psutil for process names: resolving 'exe' opens every
+    # process, while almost all of them are rejected by name anyway.
     processes = [
-        p for p in psutil.process_iter(['name', 'exe'])
+        p for p in psutil.process_iter(['name'])
         if os.path.splitext(p.info['name']  # type:ignore
                             )[0].lower() == 'reaper'
     ]
@@ -56,11 +64,17 @@ def get_reaper_process_path() -> str:
         raise RuntimeError(
             'More than one REAPER instance is currently running.'
         )
-    return processes[0].info['exe']  # type:ignore
+    return processes[0].exe()
 
 
+@functools.lru_cache(maxsize=None)
 def get_resource_path(detect_portable_install: bool = True) -> str:
     for dir in get_candidate_directories(detect_portable_install):
-        if os.path.exists(os.path.join(dir, 'reaper.ini')):
-            return dir
+        # os.stat in a try/except is one syscall, while os.path.exists
+        # goes through extra error handling for the same answer.
+        try:
+            os.stat(os.path.join(dir, 'reaper.ini'))
+        except OSError:
+            continue
+        return dir
     raise RuntimeError('Cannot find resource path')
@@ -29,6 +29,7 @@ Below are the original copyright and license:
 
 import ctypes.util
 import ctypes
+import functools
 import os
 import sys
 import sysconfig
@@ -191,6 +192,7 @@ def get_sharedlib_suffix() -> str:
     return suffix
 
 
+@functools.lru_cache(maxsize=None)
 def is_apple() -> bool:
     """Return whether OS is MacOS or OSX."""
     return sys.platform == "darwin"
@@ -204,6 +206,7 @@ def is_valid(path: str) -> bool:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def is_windows() -> bool:
     """Return whether OS is Windows."""
     return os.name == "nt"
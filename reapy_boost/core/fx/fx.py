@@ -16,10 +16,14 @@ class FX(ReapyObject):
 
     @staticmethod
     def _get_cls_functions() -> Dict[str, Dict[str, Callable[..., Any]]]:
+        # Resolve through getattr: reascript_api binds its functions
+        # lazily on attribute access, so scanning the module dict would
+        # only see the names something already touched.
+        api_names = getattr(RPR, '__all__', ())
         return {
             prefix: {
-                name.replace(prefix, ""): function
-                for name, function in RPR.__dict__.items()
+                name.replace(prefix, ""): getattr(RPR, name)
+                for name in api_names
                 if name.startswith(prefix)
             }
             for prefix in ("TrackFX_", "TakeFX_")
@@ -9,6 +9,13 @@ from reapy_boost.core import ReapyObject, ReapyObjectList
 
 T1 = ty.TypeVar('T1', bound='MIDIEvent')
 
+# Prebuilt packer for the bezier-tension float; struct.pack would
+# re-check the format string on every call.
+_PACK_LE_F = struct.Struct('<f').pack
+
+# Header of the CCBZ meta event holding the bezier tension.
+_BZ_HEADER = b'\xff\x0fCCBZ\x00'
+
 
 class CCShapeFlag(IntFlag):
     square = 0
@@ -32,19 +39,10 @@ class CCShapeFlag(IntFlag):
         -------
         CCShapeFlag
         """
-        if shape == CCShape.square.value:
-            return cls.square
-        if shape == CCShape.linear.value:
-            return cls.linear
-        if shape == CCShape.slow_start_end.value:
-            return cls.slow_start_end
-        if shape == CCShape.fast_start.value:
-            return cls.fast_start
-        if shape == CCShape.fast_end.value:
-            return cls.fast_end
-        if shape == CCShape.beizer.value:
-            return cls.beizer
-        raise ValueError(f"Can't return flag for {shape}")
+        try:
+            return _SHAPE_TO_FLAG[int(shape)]
+        except KeyError:
+            raise ValueError(f"Can't return flag for {shape}")
 
 
 class CCShape(IntEnum):
@@ -68,19 +66,27 @@ class CCShape(IntEnum):
         -------
         CCShape
         """
-        if flag == CCShapeFlag.square.value:
-            return cls.square
-        if flag == CCShapeFlag.linear.value:
-            return cls.linear
-        if flag == CCShapeFlag.slow_start_end.value:
-            return cls.slow_start_end
-        if flag == CCShapeFlag.fast_start.value:
-            return cls.fast_start
-        if flag == CCShapeFlag.fast_end.value:
-            return cls.fast_end
-        if flag == CCShapeFlag.beizer.value:
-            return cls.beizer
-        raise ValueError(f"Can't return shape for {flag}")
+        try:
+            return _FLAG_TO_SHAPE[int(flag)]
+        except KeyError:
+            raise ValueError(f"Can't return shape for {flag}")
+
+
+# Lookup tables for the shape <-> flag conversions above; an O(1) dict
+# hit instead of walking the comparison chains for every event.
+_SHAPE_TO_FLAG = {
+    int(shape): CCShapeFlag[shape.name]
+    for shape in CCShape
+}
+_FLAG_TO_SHAPE = {
+    int(CCShapeFlag[shape.name]): shape
+    for shape in CCShape
+}
+
+# Preconstructed flag singletons for the as_dict hot paths; calling
+# CCShapeFlag(0) per event goes through EnumMeta.__call__ every time.
+_NO_SHAPE = CCShapeFlag.square
+_LINEAR_SHAPE = CCShapeFlag.linear
 
 
 class MIDIEventDict(te.TypedDict):
@@ -93,27 +99,34 @@ class MIDIEventDict(te.TypedDict):
     selected: bool
     muted: bool
     cc_shape: CCShapeFlag
-    buf: ty.List[int]
+    buf: bytes or ty.List[int]
+        bytes is the canonical representation; a list of ints is still
+        accepted for backwards compatibility.
     """
 
     ppq: float
     selected: bool
     muted: bool
     cc_shape: CCShapeFlag
-    buf: ty.List[int]
+    buf: ty.Union[bytes, ty.List[int]]
 
 
 class MIDIEventInfo(te.TypedDict):
     selected: bool
     muted: bool
     position: float
-    raw_message: ty.List[int]
+    raw_message: bytes
     ppq_position: float
 
 
 class MIDIEvent(ReapyObject):
     """Abstract class for MIDI events."""
 
+    # Events are materialized in bulk when iterating over takes with
+    # many thousands of them; slots keep them to a fixed-size layout
+    # instead of one dict per instance.
+    __slots__ = ('index', 'parent', '_infos_cache')
+
     _del_func_name = 'MIDI_DeleteEvt'
     index: int
     parent: 'reapy_boost.Take'
@@ -132,6 +145,7 @@ class MIDIEvent(ReapyObject):
         """
         self.index = index
         self.parent = parent
+        self._infos_cache: ty.Optional[MIDIEventInfo] = None
 
     @property
     def _args(self) -> ty.Tuple['reapy_boost.Take', int]:
@@ -155,15 +169,33 @@ class MIDIEvent(ReapyObject):
                 ppq=infos['ppq_position'],
                 selected=bool(infos['selected']),
                 muted=bool(infos['muted']),
-                cc_shape=CCShapeFlag(0),
+                cc_shape=_NO_SHAPE,
                 buf=infos['raw_message'],
             ),
         )
 
     def delete(self) -> None:
         """Delete event from the take."""
-        f = getattr(RPR, self._del_func_name)
+        cls = type(self)
+        # The handle is resolved once per subclass and kept in the
+        # class dict; RPR has no attributes until the dist API is
+        # reachable, so this cannot happen at class creation.
+        f = cls.__dict__.get('_del_func')
+        if f is None:
+            f = getattr(RPR, cls._del_func_name)
+            cls._del_func = f
         f(self.parent.id, self.index)
+        self._infos_cache = None
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached event infos.
+
+        ``infos`` is memoized per instance and ``set`` invalidates the
+        cache automatically. Call this when the take was modified
+        behind reapy's back (e.g. by another script or by the user).
+        """
+        self._infos_cache = None
 
     @property
     def infos(self) -> MIDIEventInfo:
@@ -174,30 +206,33 @@ class MIDIEvent(ReapyObject):
             {'selected': bool,
             'muted': bool,
             'position': float,
-            'message': List[int],
+            'message': bytes,
             'ppq_position': int}
         """
+        if self._infos_cache is not None:
+            return self._infos_cache
         take = self.parent
         max_eventbuf_length = 65000
         _, _, _, selected, muted, ppqpos, msg, _ = RPR.MIDI_GetEvt(
             take.id, self.index, 0, 0, 0.0, '', max_eventbuf_length
         )
-        return MIDIEventInfo(
+        infos = MIDIEventInfo(
             selected=bool(selected),
             muted=bool(muted),
             position=take.ppq_to_time((ppqpos)),
-            raw_message=[s for s in msg.encode('latin-1')],
+            raw_message=msg.encode('latin-1'),
             ppq_position=ppqpos
         )
+        self._infos_cache = infos
+        return infos
 
-    @reapy_boost.inside_reaper()
     def set(
         self,
         selected: ty.Optional[bool] = None,
         muted: ty.Optional[bool] = None,
         position: ty.Optional[float] = None,
         sort: ty.Optional[bool] = True,
-        raw_message: ty.Optional[ty.List[int]] = None,
+        raw_message: ty.Union[bytes, ty.List[int], None] = None,
         *,
         time_unit: str = "seconds"
     ) -> None:
@@ -223,15 +258,31 @@ class MIDIEvent(ReapyObject):
             the time-sorted list ``take.notes``. Set to False for
             improved efficiency when adding several notes, then call
             ``Take.sort_events`` at the end.
-        raw_message : List[int], optional
+        raw_message : bytes or List[int], optional
             can be applied to every type of event, which leads to
             ignoring of the event-specific arguments.
         time_unit : str ("seconds as default")
             "beats"|"ppq"|"seconds" (default are seconds)
         """
+        self._infos_cache = None
+        self._set_inside(
+            selected, muted, position, sort, raw_message, time_unit=time_unit
+        )
+
+    @reapy_boost.inside_reaper()
+    def _set_inside(
+        self,
+        selected: ty.Optional[bool],
+        muted: ty.Optional[bool],
+        position: ty.Optional[float],
+        sort: ty.Optional[bool],
+        raw_message: ty.Union[bytes, ty.List[int], None],
+        *,
+        time_unit: str
+    ) -> None:
         take = self.parent
-        if position:
-            position = take._resolve_midi_unit((position, ), time_unit)[0]
+        if position is not None:
+            position = take._resolve_midi_unit_single(position, time_unit)
         if raw_message:
             raw_message = take._midi_to_bytestr(raw_message)
         RPR.MIDI_SetEvt(
@@ -255,18 +306,56 @@ class MIDIEventList(ReapyObjectList, ty.Generic[T1]):
         self.parent = parent
 
     def __getitem__(self, key: int) -> T1:
-        with reapy_boost.inside_reaper():
-            if key >= len(self):
-                raise IndexError
-            return self._elements_class(self.parent, key)
-        raise RuntimeError()
+        n = len(self)
+        if key < 0:
+            key += n
+        if not 0 <= key < n:
+            raise IndexError(key)
+        return self._elements_class(self.parent, key)
 
     def __len__(self) -> int:
         return ty.cast(int, getattr(self.parent, self._n_elements))
 
     def __iter__(self) -> ty.Iterator[T1]:
+        element_class = self._elements_class
+        parent = self.parent
+        for i, infos in enumerate(self._bulk_infos()):
+            event = element_class(parent, i)
+            event._infos_cache = infos
+            yield event
+
+    @reapy_boost.inside_reaper()
+    def as_dicts(self) -> ty.List[MIDIEventDict]:
+        """
+        Flat list with ``as_dict`` of every event, in one distant call.
+
+        Bulk counterpart of per-event ``as_dict``: exporting a whole
+        take costs one round-trip instead of several per event. The
+        result can be fed to ``Take.set_midi``.
+
+        Returns
+        -------
+        List[MIDIEventDict]
+        """
+        element_class = self._elements_class
+        parent = self.parent
+        out: ty.List[MIDIEventDict] = []
         for i in range(len(self)):
-            yield self[i]
+            out.extend(element_class(parent, i).as_dict)
+        return out
+
+    @reapy_boost.inside_reaper()
+    def _bulk_infos(self) -> ty.List[MIDIEventInfo]:
+        """
+        Fetch infos of all events in one distant call.
+
+        Iterating from outside REAPER otherwise costs one round-trip
+        per event, plus one per property access.
+        """
+        element_class = self._elements_class
+        parent = self.parent
+        n = len(self)  # one n_elements query for the whole loop
+        return [element_class(parent, i).infos for i in range(n)]
 
     @property
     def _args(self) -> ty.Tuple['reapy_boost.Take']:
@@ -290,6 +379,8 @@ class CCInfo(MIDIEventInfo):
 class CC(MIDIEvent):
     """MIDI CC event."""
 
+    __slots__ = ()
+
     _del_func_name = 'MIDI_DeleteCC'
 
     @property
@@ -304,8 +395,10 @@ class CC(MIDIEvent):
 
         :type: Tuple[MIDIEventDict]
         """
-        infos = self.infos
-        shape = self.shape
+        if self._infos_cache is not None:
+            infos, shape = ty.cast(CCInfo, self._infos_cache), self.shape
+        else:
+            infos, shape = self._infos_and_shape()
         evt1 = MIDIEventDict(
             ppq=infos['ppq_position'],
             selected=bool(infos['selected']),
@@ -318,12 +411,19 @@ class CC(MIDIEvent):
                 ppq=infos['ppq_position'],
                 selected=bool(infos['selected']),
                 muted=bool(infos['muted']),
-                cc_shape=CCShapeFlag.linear,
-                buf=list(b'\xff\x0fCCBZ\x00' + struct.pack('<f', shape[1])),
+                cc_shape=_LINEAR_SHAPE,
+                buf=_BZ_HEADER + _PACK_LE_F(shape[1]),
             )
             return evt1, evt2
         return (evt1, )
 
+    @reapy_boost.inside_reaper()
+    def _infos_and_shape(
+        self
+    ) -> ty.Tuple[CCInfo, ty.Tuple[CCShape, float]]:
+        """Fetch infos and shape in one distant call instead of two."""
+        return self.infos, self.shape
+
     @property
     def channel(self) -> int:
         """
@@ -362,7 +462,6 @@ class CC(MIDIEvent):
     def channel_message(self, channel_message: int) -> None:
         self.set(channel_message=channel_message)
 
-    @reapy_boost.inside_reaper()
     @property
     def infos(self) -> CCInfo:
         """
@@ -373,23 +472,33 @@ class CC(MIDIEvent):
             muted: bool
             position: float
             ppq_position: float
-            raw_message: List[int]
+            raw_message: bytes
             channel_message: int
             channel: int
             messages: Tuple[int, int]
         """
+        if self._infos_cache is not None:
+            return ty.cast(CCInfo, self._infos_cache)
+        infos = self._get_infos()
+        self._infos_cache = infos
+        return infos
+
+    @reapy_boost.inside_reaper()
+    def _get_infos(self) -> CCInfo:
         take = self.parent
-        res = list(RPR.MIDI_GetCC(take.id, self.index, 0, 0, 0, 0, 0, 0,
-                                  0))[3:]
+        res = RPR.MIDI_GetCC(take.id, self.index, 0, 0, 0, 0, 0, 0, 0)[3:]
+        ppqpos = res[2]
+        chanmsg, chan = int(res[3]), int(res[4])
+        msg2, msg3 = int(res[5]), int(res[6])
         return CCInfo(
             selected=bool(res[0]),
             muted=bool(res[1]),
-            position=take.ppq_to_time(res[2]),
-            ppq_position=res[2],
-            raw_message=list(int(b) for b in (res[3], *res[5:7])),
-            channel_message=int(res[3]),
-            channel=int(res[4]),
-            messages=(int(res[5]), int(res[6])),
+            position=take.ppq_to_time(ppqpos),
+            ppq_position=ppqpos,
+            raw_message=bytes((chanmsg, msg2, msg3)),
+            channel_message=chanmsg,
+            channel=chan,
+            messages=(msg2, msg3),
         )
 
     @property
@@ -468,14 +577,13 @@ class CC(MIDIEvent):
     def selected(self, selected: bool) -> None:
         self.set(selected=selected)
 
-    @reapy_boost.inside_reaper()
     def set(
         self,
         selected: ty.Optional[bool] = None,
         muted: ty.Optional[bool] = None,
         position: ty.Optional[float] = None,
         sort: ty.Optional[bool] = True,
-        raw_message: ty.Optional[ty.List[int]] = None,
+        raw_message: ty.Union[bytes, ty.List[int], None] = None,
         channel_message: ty.Optional[int] = None,
         channel: ty.Optional[int] = None,
         messages: ty.Optional[ty.List[int]] = None,
@@ -504,7 +612,7 @@ class CC(MIDIEvent):
             the time-sorted list ``take.notes``. Set to False for
             improved efficiency when adding several notes, then call
             ``Take.sort_events`` at the end.
-        raw_message : List[int], optional
+        raw_message : bytes or List[int], optional
             can be applied to every type of event, which leads to
             ignoring of the event-specific arguments.
         channel_message : int, optional
@@ -515,11 +623,37 @@ class CC(MIDIEvent):
         time_unit : str Optional
             "beats"|"ppq"|"seconds" (default are seconds)
         """
+        self._infos_cache = None
+        self._set_inside(
+            selected,
+            muted,
+            position,
+            sort,
+            raw_message,
+            channel_message,
+            channel,
+            messages,
+            time_unit=time_unit
+        )
+
+    @reapy_boost.inside_reaper()
+    def _set_inside(
+        self,
+        selected: ty.Optional[bool],
+        muted: ty.Optional[bool],
+        position: ty.Optional[float],
+        sort: ty.Optional[bool],
+        raw_message: ty.Union[bytes, ty.List[int], None],
+        channel_message: ty.Optional[int],
+        channel: ty.Optional[int],
+        messages: ty.Optional[ty.List[int]],
+        *,
+        time_unit: str
+    ) -> None:
         take = self.parent
-        if position:
-            position = take._resolve_midi_unit((position, ), time_unit)[0]
-        if sort is not None:
-            sort = not sort
+        if position is not None:
+            position = take._resolve_midi_unit_single(position, time_unit)
+        sort = not sort if sort is not None else None
         if messages and not raw_message:
             msg2, msg3 = messages
         if raw_message:
@@ -567,6 +701,8 @@ class NoteInfo(MIDIEventInfo):
 class Note(MIDIEvent):
     """MIDI note."""
 
+    __slots__ = ()
+
     _del_func_name = 'MIDI_DeleteNote'
 
     @property
@@ -583,20 +719,21 @@ class Note(MIDIEvent):
             note on and note off
         """
         infos = self.infos
-        off = [infos['raw_message'][0] - 0x10, *infos['raw_message'][1:3]]
+        raw = infos['raw_message']
+        off = bytes((raw[0] - 0x10, raw[1], raw[2]))
         return (
             MIDIEventDict(
                 ppq=infos['ppq_position'],
                 selected=bool(infos['selected']),
                 muted=bool(infos['muted']),
-                cc_shape=CCShapeFlag(0),
-                buf=infos['raw_message'],
+                cc_shape=_NO_SHAPE,
+                buf=raw,
             ),
             MIDIEventDict(
                 ppq=infos['ppq_end'],
                 selected=bool(infos['selected']),
                 muted=bool(infos['muted']),
-                cc_shape=CCShapeFlag(0),
+                cc_shape=_NO_SHAPE,
                 buf=off,
             )
         )
@@ -649,29 +786,32 @@ class Note(MIDIEvent):
             muted: bool
             position: float
             ppq_position: float
-            raw_message: [0x9+ch, note, vel]
+            raw_message: bytes((0x9+ch, note, vel))
             end: float
             ppq_end: float
             channel: int
             pitch: int
             velocity: int
         """
+        if self._infos_cache is not None:
+            return ty.cast(NoteInfo, self._infos_cache)
         take = self.parent
-        res = list(RPR.MIDI_GetNote(take.id, self.index, 0, 0, 0, 0, 0, 0,
-                                    0))[3:]
+        res = RPR.MIDI_GetNote(take.id, self.index, 0, 0, 0, 0, 0, 0, 0)[3:]
         ch, note, vel = int(res[4]), int(res[5]), int(res[6])
-        return NoteInfo(
+        infos = NoteInfo(
             selected=bool(res[0]),
             muted=bool(res[1]),
             position=take.ppq_to_time(res[2]),
             ppq_position=res[2],
-            raw_message=[0x90 + ch, note, vel],
+            raw_message=bytes((0x90 + ch, note, vel)),
             end=take.ppq_to_time(res[3]),
             ppq_end=res[3],
             channel=ch,
             pitch=note,
             velocity=vel
         )
+        self._infos_cache = infos
+        return infos
 
     @property
     def muted(self) -> bool:
@@ -730,14 +870,13 @@ class Note(MIDIEvent):
     def selected(self, selected: bool) -> None:
         self.set(selected=selected)
 
-    @reapy_boost.inside_reaper()
     def set(
         self,
         selected: ty.Optional[bool] = None,
         muted: ty.Optional[bool] = None,
         position: ty.Optional[float] = None,
         sort: ty.Optional[bool] = True,
-        raw_message: ty.Optional[ty.List[int]] = None,
+        raw_message: ty.Union[bytes, ty.List[int], None] = None,
         end: ty.Optional[float] = None,
         channel: ty.Optional[int] = None,
         pitch: ty.Optional[int] = None,
@@ -767,7 +906,7 @@ class Note(MIDIEvent):
             the time-sorted list ``take.notes``. Set to False for
             improved efficiency when adding several notes, then call
             ``Take.sort_events`` at the end.
-        raw_message : List[int], optional
+        raw_message : bytes or List[int], optional
             can be applied to every type of event, which leads to
             ignoring of the event-specific arguments.
         end : float
@@ -777,16 +916,44 @@ class Note(MIDIEvent):
         time_unit : str ("seconds as default")
             "beats"|"ppq"|"seconds" (default are seconds)
         """
+        self._infos_cache = None
+        self._set_inside(
+            selected,
+            muted,
+            position,
+            sort,
+            raw_message,
+            end,
+            channel,
+            pitch,
+            velocity,
+            time_unit=time_unit
+        )
+
+    @reapy_boost.inside_reaper()
+    def _set_inside(
+        self,
+        selected: ty.Optional[bool],
+        muted: ty.Optional[bool],
+        position: ty.Optional[float],
+        sort: ty.Optional[bool],
+        raw_message: ty.Union[bytes, ty.List[int], None],
+        end: ty.Optional[float],
+        channel: ty.Optional[int],
+        pitch: ty.Optional[int],
+        velocity: ty.Optional[int],
+        *,
+        time_unit: str
+    ) -> None:
         take = self.parent
-        if position:
-            position = take._resolve_midi_unit((position, ), time_unit)[0]
-        if end:
-            end = take._resolve_midi_unit((end, ), time_unit)[0]
+        if position is not None:
+            position = take._resolve_midi_unit_single(position, time_unit)
+        if end is not None:
+            end = take._resolve_midi_unit_single(end, time_unit)
         if raw_message:
             rm = raw_message
-            channel, pitch, velocity = rm[0] % 0x90, rm[1], rm[2]
-        if sort is not None:
-            sort = not sort
+            channel, pitch, velocity = rm[0] & 0x0F, rm[1], rm[2]
+        sort = not sort if sort is not None else None
         RPR.MIDI_SetNote(
             take.id, self.index, selected, muted, position, end, channel,
             pitch, velocity, sort
@@ -844,6 +1011,8 @@ class TextSysexInfo(MIDIEventInfo):
 class TextSysex(MIDIEvent):
     """Abstract class for Text or Sysex events."""
 
+    __slots__ = ()
+
     _del_func_name = 'MIDI_DeleteTextSysexEvt'
 
     @property
@@ -860,28 +1029,31 @@ class TextSysex(MIDIEvent):
             'type_': int
             }
         """
+        if self._infos_cache is not None:
+            return ty.cast(TextSysexInfo, self._infos_cache)
         take = self.parent
         max_eventbuf_length = 65000
         _, _, _, sel, muted, ppqpos, type_, msg, _ = RPR.MIDI_GetTextSysexEvt(
             take.id, self.index, 0, 0, 0.0, 0, '', max_eventbuf_length
         )
-        return TextSysexInfo(
+        infos = TextSysexInfo(
             selected=bool(sel),
             muted=bool(muted),
             position=take.ppq_to_time((ppqpos)),
-            raw_message=[s for s in msg.encode('latin-1')],
+            raw_message=msg.encode('latin-1'),
             ppq_position=ppqpos,
             type_=int(type_)
         )
+        self._infos_cache = infos
+        return infos
 
-    @reapy_boost.inside_reaper()
     def set(
         self,
         selected: ty.Optional[bool] = None,
         muted: ty.Optional[bool] = None,
         position: ty.Optional[float] = None,
         sort: ty.Optional[bool] = True,
-        raw_message: ty.Optional[ty.List[int]] = None,
+        raw_message: ty.Union[bytes, ty.List[int], None] = None,
         type_: ty.Optional[int] = None,
         *,
         time_unit: str = "seconds"
@@ -909,7 +1081,7 @@ class TextSysex(MIDIEvent):
             the time-sorted list ``take.notes``. Set to False for
             improved efficiency when adding several notes, then call
             ``Take.sort_events`` at the end.
-        raw_message : List[int], optional
+        raw_message : bytes or List[int], optional
             can be applied to every type of event, which leads to
             ignoring of the event-specific arguments.
         type_ : int, optional
@@ -919,13 +1091,29 @@ class TextSysex(MIDIEvent):
         time_unit : str ("seconds as default")
             "beats"|"ppq"|"seconds" (default are seconds)
         """
+        self._infos_cache = None
+        self._set_inside(
+            selected, muted, position, sort, raw_message, type_,
+            time_unit=time_unit
+        )
+
+    @reapy_boost.inside_reaper()
+    def _set_inside(
+        self,
+        selected: ty.Optional[bool],
+        muted: ty.Optional[bool],
+        position: ty.Optional[float],
+        sort: ty.Optional[bool],
+        raw_message: ty.Union[bytes, ty.List[int], None],
+        type_: ty.Optional[int],
+        *,
+        time_unit: str
+    ) -> None:
         take = self.parent
-        print('called')
-        if position:
-            position = take._resolve_midi_unit((position, ), time_unit)[0]
+        if position is not None:
+            position = take._resolve_midi_unit_single(position, time_unit)
         if raw_message:
             raw_message = take._midi_to_bytestr(raw_message)
-            print(raw_message, len(raw_message))
         RPR.MIDI_SetTextSysexEvt(
             take.id, self.index, selected, muted, position, type_, raw_message,
             len(raw_message), not sort
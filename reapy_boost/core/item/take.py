@@ -4,6 +4,11 @@ import reapy_boost
 from reapy_boost import reascript_api as RPR
 from reapy_boost.core import ReapyObject
 
+# Prebound unpacker for the MIDI_GetAllEvts parse loop; unpack_from
+# reads at an offset without slicing the buffer and skips the per-call
+# format string check of struct.unpack.
+_UNPACK_U32_FROM = struct.Struct('<I').unpack_from
+
 
 class Take(ReapyObject):
 
@@ -63,7 +68,7 @@ class Take(ReapyObject):
         --------
         Take.add_note
         """
-        ppqpos = self._resolve_midi_unit((position, ), unit)[0]
+        ppqpos = self._resolve_midi_unit_single(position, unit)
         bytestr = self._midi_to_bytestr(message)
         RPR.MIDI_InsertEvt(  # type:ignore
             self.id, False, False, ppqpos, bytestr, len(bytestr)
@@ -188,7 +193,7 @@ class Take(ReapyObject):
             ⋅ 15=REAPER notation event.
         """
         bytestr = self._midi_to_bytestr(message)
-        ppqpos = self._resolve_midi_unit((position, ), unit)[0]
+        ppqpos = self._resolve_midi_unit_single(position, unit)
         RPR.MIDI_InsertTextSysexEvt(  # type:ignore
             self.id, False, False, ppqpos, evt_type, bytestr, len(bytestr)
         )
@@ -334,31 +339,33 @@ class Take(ReapyObject):
             self.id, '', size
         )
         msg = buf.encode('latin-1')
-        out = []
+        out: List['reapy_boost.MIDIEventDict'] = []
         i = 0
         ppq = 0
         length = len(msg)
-        while i < length:
-            if length - i < 9:
-                break
-            ofst, flag, len_ = (
-                struct.unpack('<I', msg[i:i + 4])[0], int(msg[i + 4]),
-                struct.unpack('<I', msg[i + 5:i + 9])[0]
-            )
+        # Locals for the hot loop: attribute lookups on every event add
+        # up for takes with tens of thousands of events.
+        unpack_u32 = _UNPACK_U32_FROM
+        cc_shape_flag = reapy_boost.CCShapeFlag
+        event_dict = reapy_boost.MIDIEventDict
+        append = out.append
+        while length - i >= 9:
+            ofst = unpack_u32(msg, i)[0]
+            flag = msg[i + 4]
+            len_ = unpack_u32(msg, i + 5)[0]
             ppq += ofst
             buf_b = msg[i + 9:i + 9 + len_]
-            buf_int = [int(b) for b in buf_b]
             i += 9 + len_
             if len_ == 0:
                 i += 1
                 continue
-            out.append(
-                reapy_boost.MIDIEventDict(
+            append(
+                event_dict(
                     ppq=ppq,
                     selected=bool(flag & 1),
                     muted=bool(flag & 2),
-                    cc_shape=reapy_boost.CCShapeFlag(flag & 0b11110000),
-                    buf=buf_int
+                    cc_shape=cc_shape_flag(flag & 0b11110000),
+                    buf=buf_b
                 )
             )
         return out
@@ -586,6 +593,34 @@ class Take(ReapyObject):
 
         return cast(Tuple[int, int], (resolver(pos) for pos in pos_tuple))
 
+    def _resolve_midi_unit_single(
+        self, pos: float, unit: str = "seconds"
+    ) -> float:
+        """Get position as ppq from a single position.
+
+        Scalar fast path of ``_resolve_midi_unit``: no tuple wrapping
+        and unwrapping for the common one-position case.
+
+        Parameters
+        ----------
+        pos : float
+            position time in beats, ppq or seconds.
+        unit : str, optional
+            type of position: seconds|beats|ppq
+
+        Returns
+        -------
+        float
+            the same position normalized to ppq
+        """
+        if unit == "ppq":
+            return pos
+        if unit == "beats":
+            return self.beat_to_ppq(pos)
+        if unit == "seconds":
+            return self.time_to_ppq(pos)
+        raise ValueError('unit param should be one of seconds|beats|ppq')
+
     def select_all_midi_events(self, select: bool = True) -> None:
         """
         Select or unselect all MIDI events.
@@ -640,7 +675,7 @@ class Take(ReapyObject):
         out = b''
         start_ppq = 0
         if start is not None:
-            start_ppq = self._resolve_midi_unit((start, ), unit)[0]
+            start_ppq = self._resolve_midi_unit_single(start, unit)
         last_ppq = 0 - start_ppq
         for msg in midi:
             evt = b''
@@ -33,7 +33,9 @@ __all__ = [
     'reaprint',
     'remove_reascript',
     'rgb_from_native',
+    'rgb_from_native_bulk',
     'rgb_to_native',
+    'rgb_to_native_bulk',
     'set_ext_state',
     'set_global_automation_mode',
     'show_console_message',
@@ -601,6 +601,44 @@ def rgb_to_native(rgb: Tuple[int, int, int]) -> int:
     return native_color
 
 
+@reapy_boost.inside_reaper()
+def rgb_from_native_bulk(
+    native_colors: List[int]
+) -> List[Tuple[int, int, int]]:
+    """
+    Extract RGB values from many native colors in one distant call.
+
+    Parameters
+    ----------
+    native_colors : list of int
+        Native colors.
+
+    Returns
+    -------
+    list of (int, int, int)
+        RGB triplets, in the order of `native_colors`.
+    """
+    return [rgb_from_native(color) for color in native_colors]
+
+
+@reapy_boost.inside_reaper()
+def rgb_to_native_bulk(rgbs: List[Tuple[int, int, int]]) -> List[int]:
+    """
+    Make native colors from many RGB triplets in one distant call.
+
+    Parameters
+    ----------
+    rgbs : list of (int, int, int)
+        RGB triplets of integers between 0 and 255.
+
+    Returns
+    -------
+    list of int
+        Native colors, in the order of `rgbs`.
+    """
+    return [rgb_to_native(rgb) for rgb in rgbs]
+
+
 def set_ext_state(section: str,
                   key: str,
                   value: Union[str, object],
@@ -883,11 +921,17 @@ class ExtState(Generic[T]):
         self.persist = persist
         self.pickled = pickled
         self.project = project
-        if value is not None:
-            if persist and self.value is None:
-                self.value = value
-        if not persist:
-            del self.value
+        if value is not None or not persist:
+            # One held connection for the probe/write/delete sequence
+            # instead of a round-trip per call. The default
+            # (value=None, persist=True) makes no distant calls, so it
+            # must not touch the connection at all.
+            with reapy_boost.inside_reaper():
+                if value is not None:
+                    if persist and self.value is None:
+                        self.value = value
+                if not persist:
+                    del self.value
 
     @property
     def value(self) -> Optional[T]:
@@ -917,10 +961,11 @@ class ExtState(Generic[T]):
         project.set_ext_state(self.section, self.key, value, self.pickled)
 
     def _value_from_reaper(self) -> Optional[T]:
-        if not has_ext_state(self.section, self.key):
-            return None
-        return get_ext_state(self.section, self.key,
-                             self.pickled)  # type:ignore
+        with reapy_boost.inside_reaper():
+            if not has_ext_state(self.section, self.key):
+                return None
+            return get_ext_state(self.section, self.key,
+                                 self.pickled)  # type:ignore
 
     def _value_from_project(self) -> Optional[T]:
         project = self._check_project()
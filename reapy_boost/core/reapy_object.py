@@ -24,7 +24,14 @@ class ReapyMetaclass(type):
 
 
 class ReapyObject(metaclass=ReapyMetaclass):
-    """Base class for reapy_boost objects."""
+    """Base class for reapy_boost objects.
+
+    The base class only reserves a slot for ``id``; subclasses that
+    declare their own ``__slots__`` stay dict-less (lighter instances
+    when they are created by the thousands), while subclasses that
+    don't still get a ``__dict__`` as usual.
+    """
+    __slots__ = ('id', )
     id: str
 
     def __eq__(self, other: object) -> bool:
@@ -78,6 +85,8 @@ class ReapyObject(metaclass=ReapyMetaclass):
 class ReapyObjectList(ReapyObject):
     """Abstract class for list of ReapyObjects."""
 
+    __slots__ = ()
+
     def __iter__(self) -> Iterator[ReapyObject]:
         for i in range(len(self)):
             yield self[i]
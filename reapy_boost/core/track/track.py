@@ -1,3 +1,5 @@
+import functools
+
 import reapy_boost
 from reapy_boost import reascript_api as RPR
 from reapy_boost.core import ReapyObject, ReapyObjectList
@@ -47,12 +49,15 @@ class Track(ReapyObject):
     Track("(MediaTrack*)0x00000000110A1AD0")
     """
 
+    __slots__ = ('_project', '_name_cache')
+
     def __init__(
         self,
         id: ty.Union[str, int],
         project: ty.Optional[Project] = None
     ) -> None:
         self._project = None
+        self._name_cache: ty.Optional[str] = None
         if isinstance(id, int):  # id is a track index
             id = ty.cast(str, RPR.GetTrack(project.id, id))  # type:ignore
             if id.endswith("0x0000000000000000"):
@@ -177,7 +182,7 @@ class Track(ReapyObject):
         """
         if end is None:
             end = start + length
-        item = reapy_boost.Item(
+        item = Item(
             RPR.AddMediaItemToTrack(self.id)
         )  # type:ignore
         item.position = start
@@ -205,7 +210,7 @@ class Track(ReapyObject):
         """
         item_id = RPR.CreateNewMIDIItemInProj(  # type:ignore
             self.id, start, end, quantize)[0]
-        item = reapy_boost.Item(item_id)
+        item = Item(item_id)
         return item
 
     def add_send(self, destination: ty.Optional['Track'] = None):
@@ -481,9 +486,13 @@ class Track(ReapyObject):
         """
         List of items on track.
 
+        The count and the items come back in the same distant call, so
+        when both are needed prefer ``len(track.items)`` over a
+        separate ``n_items`` query.
+
         :type: list of Item
         """
-        return self._items_inside()
+        return TrackList.items_bulk([self])[0]
 
     @reapy_boost.inside_reaper()
     def _items_inside(self) -> ty.List['reapy_boost.Item']:
@@ -493,7 +502,7 @@ class Track(ReapyObject):
                 self.id, i
             ) for i in range(n_items)
         ]
-        return list(map(reapy_boost.Item, item_ids))
+        return list(map(Item, item_ids))
 
     @property
     def is_muted(self) -> bool:
@@ -518,10 +527,7 @@ class Track(ReapyObject):
 
         :type: bool
         """
-        is_selected = bool(RPR.IsTrackSelected(  # type:ignore
-            self.id
-        ))
-        return is_selected
+        return RPR.IsTrackSelected(self.id) != 0  # type:ignore
 
     @is_selected.setter
     def is_selected(self, selected: bool) -> None:
@@ -533,10 +539,7 @@ class Track(ReapyObject):
         selected : bool
             Whether to select or unselect track.
         """
-        if selected:
-            self.select()
-        else:
-            self.unselect()
+        RPR.SetTrackSelected(self.id, bool(selected))  # type:ignore
 
     @property
     def is_solo(self) -> bool:
@@ -628,6 +631,12 @@ class Track(ReapyObject):
         Number of items on track.
 
         :type: int
+
+        See also
+        --------
+        Track.items
+            When the items themselves are also needed, ``len(items)``
+            avoids this extra distant call.
         """
         n_items = RPR.CountTrackMediaItems(self.id)  # type:ignore
         return n_items
@@ -650,15 +659,32 @@ class Track(ReapyObject):
         Name is "MASTER" for master track, "Track N" if track has no
         name.
 
+        The value is cached on the instance after the first distant
+        call. If the track gets renamed from elsewhere (e.g. in the
+        REAPER GUI), call ``invalidate_cache`` to force a new query.
+
         :type: str
             Track name .
         """
-        _, _, name, _ = RPR.GetTrackName(self.id, "", 2048)  # type:ignore
-        return name
+        if self._name_cache is None:
+            _, _, name, _ = RPR.GetTrackName(  # type:ignore
+                self.id, "", 2048)
+            self._name_cache = name
+        return self._name_cache
 
     @name.setter
     def name(self, track_name: str) -> None:
         self.set_info_string("P_NAME", track_name)
+        self._name_cache = None
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop cached track metadata.
+
+        Next access to cached properties (currently ``name``) will
+        query REAPER again.
+        """
+        self._name_cache = None
 
     @property
     def parent_track(self) -> ty.Optional['reapy_boost.Track']:
@@ -828,8 +854,9 @@ class TrackList(ReapyObjectList):
         return reapy_boost.Track(key, self.parent)
 
     def __iter__(self):
-        tracks = self[:]  # Only cost one distant call
-        for track in tracks:
+        for id in self.ids:  # Only cost one distant call
+            track = reapy_boost.Track(id)
+            track._project = self.parent
             yield track
 
     def __len__(self):
@@ -839,9 +866,152 @@ class TrackList(ReapyObjectList):
     def _args(self):
         return self.parent,
 
+    @property
+    def ids(self) -> ty.List[str]:
+        """
+        ReaScript IDs of all tracks in the list, in one distant call.
+
+        Plain strings are much cheaper to serialize than Track objects,
+        so batch helpers that only need IDs should read this list and
+        construct Track wrappers lazily, if at all.
+
+        :type: list of str
+        """
+        return self._get_ids_inside()
+
+    @reapy_boost.inside_reaper()
+    def _get_ids_inside(self) -> ty.List[str]:
+        return [track.id for track in self[:]]
+
+    @property
+    def colors(self) -> ty.List[ty.Tuple[int, int, int]]:
+        """
+        Colors of all tracks in the list, in RGB format.
+
+        Fetching (or setting) colors one track at a time costs one
+        distant call per track; this accessor does the whole loop in
+        one distant call.
+
+        :type: list of tuple of int
+        """
+        return self._get_colors_inside()
+
+    @colors.setter
+    def colors(self, colors: ty.List[ty.Tuple[int, int, int]]) -> None:
+        """
+        Set colors of all tracks in the list.
+
+        Parameters
+        ----------
+        colors : list of tuple
+            RGB triplets of integers between 0 and 255, one per track.
+        """
+        self._set_colors_inside(list(colors))
+
+    @reapy_boost.inside_reaper()
+    def map(self, function: ty.Callable[['reapy_boost.Track'],
+                                        ty.Any]) -> ty.List[ty.Any]:
+        """
+        Apply function to every track in one distant call.
+
+        Parameters
+        ----------
+        function : callable
+            Function taking a Track and returning any serializable
+            value. As with ``reapy_boost.map``, it must be resolvable
+            by module and qualified name (no lambdas) when called from
+            outside REAPER.
+
+        Returns
+        -------
+        list
+            Results of each call, in track order.
+        """
+        return [function(track) for track in self]
+
+    @reapy_boost.inside_reaper()
+    def filter(
+        self, predicate: ty.Callable[['reapy_boost.Track'], bool]
+    ) -> ty.List['reapy_boost.Track']:
+        """
+        Return tracks matching predicate, in one distant call.
+
+        Parameters
+        ----------
+        predicate : callable
+            Function taking a Track and returning bool. Same
+            restrictions as for ``TrackList.map``.
+
+        Returns
+        -------
+        list of Track
+        """
+        return [track for track in self if predicate(track)]
+
+    @reapy_boost.inside_reaper()
+    def reduce(
+        self,
+        function: ty.Callable[[ty.Any, 'reapy_boost.Track'], ty.Any],
+        initializer: ty.Optional[ty.Any] = None
+    ) -> ty.Any:
+        """
+        Reduce the track list to a single value, in one distant call.
+
+        Parameters
+        ----------
+        function : callable
+            Function of (accumulator, Track). Same restrictions as for
+            ``TrackList.map``.
+        initializer : optional
+            Initial accumulator value.
+
+        Returns
+        -------
+        The final accumulator.
+        """
+        if initializer is None:
+            return functools.reduce(function, self)
+        return functools.reduce(function, self, initializer)
+
+    @reapy_boost.inside_reaper()
+    def _get_colors_inside(self) -> ty.List[ty.Tuple[int, int, int]]:
+        return [track.color for track in self]
+
+    @reapy_boost.inside_reaper()
+    def _set_colors_inside(
+        self, colors: ty.List[ty.Tuple[int, int, int]]
+    ) -> None:
+        for track, color in zip(self, colors):
+            track.color = color
+
     @reapy_boost.inside_reaper()
     def _get_items_from_slice(self,
                               slice: slice) -> ty.List['reapy_boost.Track']:
         indices = range(*slice.indices(len(self)))
         return [self[i] for i in indices]
         # return [self[i] for i in indices]
+
+    @staticmethod
+    @reapy_boost.inside_reaper()
+    def items_bulk(
+        tracks: ty.List['reapy_boost.Track']
+    ) -> ty.List[ty.List['reapy_boost.Item']]:
+        """
+        Get items of several tracks in one distant call.
+
+        When iterating over many tracks from outside REAPER, fetching
+        items track by track costs one distant call per track. Here
+        the whole loop runs inside REAPER and results come back at
+        once.
+
+        Parameters
+        ----------
+        tracks : list of Track
+            Tracks to get items from.
+
+        Returns
+        -------
+        list of list of Item
+            Items of each track, in the same order as `tracks`.
+        """
+        return [track._items_inside() for track in tracks]
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Any, Callable, Optional, Tuple
 import reapy_boost
 from reapy_boost.core import ReapyObject
 import reapy_boost.reascript_api as RPR
@@ -6,6 +6,13 @@ import reapy_boost.reascript_api as RPR
 
 class Window(ReapyObject):
 
+    __slots__ = ()
+
+    # Resolved on first refresh() and reused: the RPR module has no
+    # attributes until the dist API is reachable, so this cannot be
+    # bound at import time.
+    _refresh_func: Optional[Callable[..., Any]] = None
+
     def __init__(self, id: int) -> None:
         self.id = id
 
@@ -15,4 +22,7 @@ class Window(ReapyObject):
 
     def refresh(self) -> None:
         """Refresh window."""
-        RPR.DockWindowRefreshForHWND(self.id)  # type:ignore
+        f = Window._refresh_func
+        if f is None:
+            f = Window._refresh_func = RPR.DockWindowRefreshForHWND  # type:ignore
+        f(self.id)
@@ -1,3 +1,4 @@
+import typing as ty
 from typing import List
 import reapy_boost
 from reapy_boost.tools import json
@@ -12,32 +13,83 @@ def _get_api_names() -> List[str]:
 
 
 if reapy_boost.is_inside_reaper():
-    # Import functions without the useless starting "RPR_".
+    # Functions are exposed without the useless starting "RPR_".
     import reaper_python as _RPR
-    __all__ = [s[4:] for s in _RPR.__dict__ if s.startswith("RPR_")]
-    for s in __all__:
-        exec("{} = _RPR.__dict__['{}']".format(s, "RPR_" + s))
+    _rpr_dict = _RPR.__dict__
+    __all__ = [s[4:] for s in _rpr_dict if s[:4] == "RPR_"]
 
     from reapy_boost import additional_api as _A_API
-    for s in _A_API.__dict__:
-        exec("from reapy_boost.additional_api import {}".format(s))
+    _a_api_dict = _A_API.__dict__
 
     # Import SWS functions.
+    _sws_dict: ty.Dict[str, ty.Any] = {}
     try:
         sys.path.append(os.path.join(_RPR.RPR_GetResourcePath(), 'Scripts'))
         import sws_python as _SWS
-        sws_functions = set(_SWS.__dict__) - set(_RPR.__dict__)
+        # dict-view difference stays in C, no intermediate sets.
+        sws_functions = _SWS.__dict__.keys() - _rpr_dict.keys()
         __all__ += list(sws_functions)
-        for s in sws_functions:
-            exec("from sws_python import {}".format(s))
+        _sws_dict = _SWS.__dict__
     except ImportError:  # SWS is not installed
         pass
+
+    def __getattr__(name: str) -> ty.Any:
+        """
+        Resolve API functions on first access (PEP 562).
+
+        Only the names a script actually touches get bound instead of
+        the whole API surface at import; resolved names are cached in
+        globals() so later accesses skip this hook. __all__ stays
+        eager: the dist API advertises it through _get_api_names and
+        star-imports need it.
+        """
+        func = None
+        if name[:1] != "_":
+            # additional_api replaces broken generated wrappers with
+            # NUL-safe reimplementations, so it must shadow the raw
+            # RPR_ binding like the eager import order did.
+            func = _a_api_dict.get(name)
+        if func is None:
+            func = _rpr_dict.get("RPR_" + name)
+        if func is None:
+            func = _sws_dict.get(name)
+        if func is None:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+        globals()[name] = func
+        return func
 else:
     if reapy_boost.dist_api_is_enabled():
         __all__ = _get_api_names()
-        func_def = (
-            "@reapy_boost.inside_reaper()\n"
-            "def {name}(*args): return (name)(*args)"
-        )
-        exec("\n".join(func_def.format(name=name) for name in __all__))
-        del func_def
+        _api_names = frozenset(__all__)
+
+        def _make_dist_func(name: str) -> ty.Any:
+            # Outside REAPER the inside_reaper() wrapper never runs
+            # the body: it ships the pre-encoded qualname to the
+            # server, which resolves this module inside REAPER where
+            # the name is bound to the real function.
+            def api_func(*args):  # type:ignore
+                raise RuntimeError(
+                    "{} can only run inside REAPER".format(name)
+                )
+
+            api_func.__name__ = name
+            api_func.__qualname__ = name
+            return reapy_boost.inside_reaper()(api_func)
+
+        def __getattr__(name: str) -> ty.Any:
+            """
+            Create the dispatching wrapper on first access (PEP 562).
+
+            Scripts typically use a handful of the advertised names;
+            wrappers for the rest are never built. Resolved names are
+            cached in globals() so later accesses skip this hook.
+            """
+            if name not in _api_names:
+                raise AttributeError(
+                    "module {!r} has no attribute {!r}".format(__name__, name)
+                )
+            func = _make_dist_func(name)
+            globals()[name] = func
+            return func
@@ -71,12 +71,25 @@ class inside_reaper(contextlib.ContextDecorator):
         if module_name == 'reapy_boost' or module_name.startswith(
             'reapy_boost.'
         ):
+            # Encode the function once at decoration time so that each
+            # call serializes a plain dict instead of going through the
+            # JSON encoder's callable dispatch again.
+            if encoded_func is None:
+                encoded_func = {
+                    "__callable__": True,
+                    "module_name": module_name,
+                    "name": func.__qualname__
+                }
 
             @functools.wraps(func)
             def wrap(*args, **kwargs):
-                f = func if encoded_func is None else encoded_func
                 client = machines.get_selected_client()
-                return client.request(f, {"args": args, "kwargs": kwargs})
+                return client.request(
+                    encoded_func, {
+                        "args": args,
+                        "kwargs": kwargs
+                    }
+                )
 
             return wrap
         # Otherwise, use the context manager
@@ -32,6 +32,8 @@ _CLASS_CACHE: ClassCache[ty.Type['reapy_boost.ReapyObject']] = ClassCache()
 class ReapyEncoder(json.JSONEncoder):
 
     def default(self, x: ty.Any) -> ty.Any:
+        if isinstance(x, bytes):
+            return {"__bytes__": x.decode('latin-1')}
         if hasattr(x, '_to_dict'):
             return x._to_dict()
         elif inspect.ismethod(x):
@@ -68,6 +70,8 @@ def object_hook(x: ty.Any) -> ty.Any:
         except KeyError:
             module = importlib.import_module(module_name)
         return operator.attrgetter(name)(sys.modules[module_name])
+    elif "__bytes__" in x:
+        return x["__bytes__"].encode('latin-1')
     elif "__slice__" in x:
         return slice(*x["args"])
     else: